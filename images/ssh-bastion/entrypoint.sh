@@ -32,6 +32,7 @@ chmod 700 "${DATA_DIR}"
 
 ensure_file "${DATA_DIR}/inventory.json" "[]" "${CODex_USER}:${CODex_USER}" 600
 ensure_file "${DATA_DIR}/labels.json" "{}" "${CODex_USER}:${CODex_USER}" 600
+ensure_file "${DATA_DIR}/fingerprints.json" "{}" "${CODex_USER}:${CODex_USER}" 600
 
 # On some hostPath volumes files may keep stale ownership after container
 # recreation (for example when an earlier image wrote them as root:root).
@@ -40,6 +41,10 @@ find "${DATA_DIR}" -maxdepth 1 -type f -exec chown "${CODex_USER}:${CODex_USER}"
 find "${DATA_DIR}" -maxdepth 1 -type f -exec chmod 600 {} +
 chown "${CODex_USER}:${CODex_USER}" "${DATA_DIR}"
 chmod 700 "${DATA_DIR}"
+# Per-target fingerprint scan locks; pre-create it so wrappers running as
+# root (kubectl exec) do not leave a directory codex cannot write to.
+install -d -o "${CODex_USER}" -g "${CODex_USER}" -m 700 "${DATA_DIR}/.fingerprint-scans"
+chown -R "${CODex_USER}:${CODex_USER}" "${DATA_DIR}/.fingerprint-scans"
 
 if [ -d "${AUTH_DIR}" ]; then
   AUTH_FILE="${AUTH_DIR}/authorized_keys"
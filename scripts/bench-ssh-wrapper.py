@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Measure per-invocation overhead of the codex ssh wrapper.
+
+The wrapper is pointed at a stub "original" ssh that exits immediately, so
+the difference between a wrapped and a direct call is the time the wrapper
+spends before ``exec``. Inventory and fingerprint cache go to a scratch
+directory. Recording still runs a real ``ssh-keyscan`` against
+``--target``/``--port`` on a cache miss; in the sync scenarios that scan is
+on the timed path and usually dominates the number.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BASTION_DIR = ROOT_DIR / "images" / "ssh-bastion"
+WRAPPER = BASTION_DIR / "bin" / "codex-ssh-wrapper"
+HOSTCTL = BASTION_DIR / "codex-hostctl"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark codex-ssh-wrapper startup-to-exec overhead")
+    parser.add_argument("--iterations", type=int, default=50, help="Invocations per scenario")
+    parser.add_argument("--target", default="codex@127.0.0.1", help="Destination passed to the wrapped ssh")
+    parser.add_argument("--port", type=int, default=22, help="Port passed to the wrapped ssh")
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=0.2,
+        help="Untimed pause after each run so detached recorders do not compete for CPU",
+    )
+    parser.add_argument("--skip-sync", action="store_true", help="Do not measure the synchronous recording mode")
+    return parser.parse_args()
+
+
+def _time_runs(cmd: Sequence[str], env: Dict[str, str], iterations: int, settle: float = 0.0) -> List[float]:
+    samples: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        subprocess.run(cmd, env=env, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - started) * 1000.0)
+        if settle:
+            time.sleep(settle)
+    return samples
+
+
+def _report(name: str, samples: List[float], baseline: float | None = None) -> None:
+    samples = sorted(samples)
+    median = statistics.median(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    line = f"{name:<28} median {median:8.2f} ms   p95 {p95:8.2f} ms"
+    if baseline is not None:
+        line += f"   overhead {median - baseline:8.2f} ms"
+    print(line)
+
+
+def main() -> int:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="codex-ssh-bench-") as scratch:
+        scratch_dir = Path(scratch)
+        originals = scratch_dir / "originals"
+        originals.mkdir()
+        stub = originals / "ssh"
+        stub.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+        stub.chmod(0o755)
+
+        env = dict(os.environ)
+        env.update(
+            {
+                "SSH_ORIGINAL_BIN_DIR": str(originals),
+                "CODEX_HOSTCTL_BIN": str(HOSTCTL),
+                "CODEX_HOSTCTL_PATH": str(HOSTCTL),
+                "DATA_DIR": str(scratch_dir / "data"),
+                "CODEX_SSH_MOTD_PATH": str(scratch_dir / "motd"),
+                "CODEX_SSH_MOTD_BASE": "",
+            }
+        )
+        ssh_args = ["-p", str(args.port), args.target, "true"]
+        wrapped = [sys.executable, str(WRAPPER), "ssh", *ssh_args]
+
+        stub_samples = _time_runs([str(stub), *ssh_args], env, args.iterations)
+        baseline = statistics.median(stub_samples)
+        _report("direct stub", stub_samples)
+        _report("bare interpreter", _time_runs([sys.executable, "-c", "pass"], env, args.iterations), baseline)
+        _report("wrapper (background)", _time_runs(wrapped, env, args.iterations, args.settle), baseline)
+        if not args.skip_sync:
+            sync_env = dict(env, CODEX_SSH_RECORD_SYNC="1")
+            _report("wrapper (sync, in-process)", _time_runs(wrapped, sync_env, args.iterations, args.settle), baseline)
+            # A missing module path makes the wrapper fall back to `codex-hostctl record`.
+            cli_env = dict(sync_env, CODEX_HOSTCTL_PATH=str(scratch_dir / "missing"))
+            _report("wrapper (sync, CLI record)", _time_runs(wrapped, cli_env, args.iterations, args.settle), baseline)
+        # Give detached recorders a moment to finish before the scratch dir goes away.
+        time.sleep(1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())